@@ -23,7 +23,7 @@ CREATE TABLE IF NOT EXISTS public.policies (
     topics TEXT[],
     sectors TEXT[],
     status VARCHAR(50),
-    updated_date TIMESTAMP WITH TIME ZONE
+    updated_datetime TIMESTAMP WITH TIME ZONE
 );
 
 CREATE INDEX IF NOT EXISTS idx_companies_sector ON public.companies(sector);
@@ -31,6 +31,8 @@ CREATE INDEX IF NOT EXISTS idx_companies_jurisdiction ON public.companies(operat
 CREATE INDEX IF NOT EXISTS idx_policies_geography ON public.policies(geography);
 CREATE INDEX IF NOT EXISTS idx_policies_status ON public.policies(status);
 CREATE INDEX IF NOT EXISTS idx_policies_published_date ON public.policies(published_date);
+CREATE INDEX IF NOT EXISTS idx_policies_geography_updated
+    ON public.policies(geography, updated_datetime DESC);
 
 CREATE INDEX IF NOT EXISTS idx_policies_topics_gin ON public.policies USING GIN(topics);
 CREATE INDEX IF NOT EXISTS idx_policies_sectors_gin ON public.policies USING GIN(sectors);
@@ -0,0 +1,26 @@
+"""
+Precompute the policy ranking columns and store them next to the cleaned policies CSV.
+
+Parsing sectors and mapping geographies to continents only depends on the cleaned data, so
+this runs once after the pipeline instead of on every ranking call. Run from the project
+root after src/main.py has written the cleaned CSV:
+
+    python -m scripts.build_cleaned_policies
+"""
+
+import pandas as pd
+
+from src.utils import add_policy_ranking_columns
+
+POLICIES_PATH = 'src/data/cleaned_policies.csv'
+POLICIES_PARQUET_PATH = 'src/data/cleaned_policies.parquet'
+
+
+def main():
+    policies_df = add_policy_ranking_columns(pd.read_csv(POLICIES_PATH))
+    policies_df.to_parquet(POLICIES_PARQUET_PATH, engine='pyarrow', index=False)
+    print(f'✅ Wrote {len(policies_df)} policies to {POLICIES_PARQUET_PATH}')
+
+
+if __name__ == '__main__':
+    main()
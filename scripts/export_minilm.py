@@ -0,0 +1,32 @@
+"""
+Export the MiniLM sentence encoder to ONNX and quantize it to INT8 for CPU inference.
+
+When the quantized model exists, ranking encodes with ONNX Runtime instead of PyTorch.
+Requires the optional optimum extra. Run from the project root:
+
+    pip install 'optimum[onnxruntime]'
+    python -m scripts.export_minilm
+"""
+
+from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+from src.ranking import MODEL_NAME, ONNX_MODEL_DIR
+
+MODEL_ID = f'sentence-transformers/{MODEL_NAME}'
+
+
+def main():
+    # Export the transformer to ONNX, then apply dynamic INT8 quantization to its weights
+    model = ORTModelForFeatureExtraction.from_pretrained(MODEL_ID, export=True)
+    quantizer = ORTQuantizer.from_pretrained(model)
+    quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=ONNX_MODEL_DIR, quantization_config=quantization_config)
+
+    AutoTokenizer.from_pretrained(MODEL_ID).save_pretrained(ONNX_MODEL_DIR)
+    print(f'✅ Wrote quantized {MODEL_NAME} to {ONNX_MODEL_DIR}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,194 @@
 import ast
+import io
 import logging
+import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from sqlmodel import Session, create_engine, delete
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from pydantic import TypeAdapter, ValidationError
+from sqlmodel import Session, delete, func, select
 
-from .models.models import Company, Policy
+from .db import get_engine
+from .models.models import Company, CompanyBase, Policy, PolicyBase
 from .settings import settings
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for cleaning policy text fields
+_HTML_RE = re.compile(r'<[^<>]*>|&nbsp;')
+_URL_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+# ISO 8601 timestamps as exported by the source system, with or without fractional
+# seconds (2025-03-03T10:59:53.464Z, 2025-04-04T02:50:12Z)
+_ISO_DATETIME_FORMAT = 'ISO8601'
+# Policy publication dates (04/11/2022)
+_PUBLISHED_DATE_FORMAT = '%d/%m/%Y'
+
+# Free-text columns, read as pandas strings and whitespace-stripped during cleaning
+_COMPANY_TEXT_FIELDS = ['name', 'operating_jurisdiction', 'sector']
+_POLICY_TEXT_FIELDS = ['name', 'description', 'geography', 'source_url', 'status']
+
+# Known column types for each data type, so read_csv parses them in one pass. Columns
+# are filtered with a callable so files missing an optional column still load, and IDs
+# are read as strings so bad values are coerced during cleaning instead of failing the read
+_COMPANY_COLUMNS = ['company_id', 'name', 'operating_jurisdiction', 'last_login', 'sector']
+_POLICY_COLUMNS = [
+	'id',
+	'name',
+	'published_date',
+	'description',
+	'geography',
+	'source_url',
+	'topics',
+	'sectors',
+	'status',
+	'updated_date',
+]
+_CSV_OPTIONS = {
+	'companies': {
+		'usecols': lambda col: col in _COMPANY_COLUMNS,
+		'dtype': {'company_id': 'string', **dict.fromkeys(_COMPANY_TEXT_FIELDS, 'string')},
+		'parse_dates': ['last_login'],
+		'date_format': {'last_login': _ISO_DATETIME_FORMAT},
+	},
+	'policies': {
+		'usecols': lambda col: col in _POLICY_COLUMNS,
+		'dtype': {'id': 'string', **dict.fromkeys(_POLICY_TEXT_FIELDS, 'string')},
+		'parse_dates': ['published_date', 'updated_date'],
+		'date_format': {
+			'published_date': _PUBLISHED_DATE_FORMAT,
+			'updated_date': _ISO_DATETIME_FORMAT,
+		},
+	},
+}
+
+# Policy columns holding lists of strings (stored as Postgres arrays)
+_LIST_FIELDS = ['topics', 'sectors']
+
+# Known policy status values; anything else is standardized to 'unknown'
+_VALID_STATUSES = ['active', 'inactive', 'draft', 'pending']
+
+# NULL marker for COPY, so empty strings are not loaded as NULL
+_COPY_NULL = '\\N'
+
+# A single list item: no brackets, quotes, commas or backslashes (escapes need the Python
+# parser), and no surrounding whitespace
+_LIST_ITEM = r'[^\[\]()"\',\\\s](?:[^\[\]()"\',\\]*[^\[\]()"\',\\\s])?'
+_LIST_ITEM_RE = re.compile(_LIST_ITEM)
+# Values the vectorized parser handles: 'a, b', ["a", "b"] or ['a', 'b']
+_SIMPLE_LIST_RE = re.compile(
+	rf'\s*{_LIST_ITEM}(?:\s*,\s*{_LIST_ITEM})*\s*'
+	rf'|\[\s*(?:"{_LIST_ITEM}"(?:\s*,\s*"{_LIST_ITEM}")*)?\s*\]'
+	rf"|\[\s*(?:'{_LIST_ITEM}'(?:\s*,\s*'{_LIST_ITEM}')*)?\s*\]"
+)
+
+# Batch validators for each data type, built once since schema construction is costly
+_VALIDATORS = {
+	'companies': TypeAdapter(list[CompanyBase]),
+	'policies': TypeAdapter(list[PolicyBase]),
+}
+
+
+def _html_replacement(match: re.Match) -> str:
+	"""Drop HTML tags and turn non-breaking space entities into plain spaces."""
+	return ' ' if match.group(0) == '&nbsp;' else ''
+
+
+def _fast_to_datetime(series: pd.Series, **kwargs) -> pd.Series:
+	"""
+	Convert a column to datetimes, parsing each distinct value only once.
+
+	Date columns repeat the same values heavily, so parsing the uniques and
+	mapping them back is much cheaper than parsing every row.
+
+	Args:
+		series: Column of date strings to convert
+		**kwargs: Additional arguments to pass to pd.to_datetime()
+	"""
+	uniques = series.dropna().unique()
+	parsed = pd.Series(pd.to_datetime(uniques, **kwargs), index=uniques)
+	return series.map(parsed)
+
+
+def _to_sql_records(data: pd.DataFrame) -> list[dict]:
+	"""
+	Convert a cleaned dataframe into row dicts ready for insertion.
+
+	Missing scalar values (NaN/NaT) become None in one vectorized pass. List
+	columns are left out of the null check and rejoined unchanged.
+
+	Args:
+		data: Cleaned dataframe to convert
+	"""
+	list_cols = [col for col in _LIST_FIELDS if col in data.columns]
+	scalars = data.drop(columns=list_cols).astype(object)
+	scalars = scalars.where(scalars.notna(), None)
+	return pd.concat([scalars, data[list_cols]], axis=1).to_dict(orient='records')
+
+
+def _to_pg_array(values) -> str | None:
+	"""
+	Format a list as a Postgres array literal for COPY, e.g. ['a', 'b'] -> '{"a","b"}'.
+
+	Args:
+		values: List of items to format (anything else is treated as NULL)
+	"""
+	if not isinstance(values, list):
+		return None
+	items = (str(item).replace('\\', '\\\\').replace('"', '\\"') for item in values)
+	return '{' + ','.join(f'"{item}"' for item in items) + '}'
+
+
+def _copy_to_postgres(session: Session, table_name: str, data: pd.DataFrame) -> None:
+	"""
+	Bulk load a cleaned dataframe with Postgres COPY FROM STDIN.
+
+	Runs on the session's own connection, so it shares the session's transaction.
+
+	Args:
+		session: Open session bound to a psycopg2 engine
+		table_name: Table to load into
+		data: Cleaned dataframe to load
+	"""
+	list_cols = [col for col in _LIST_FIELDS if col in data.columns]
+	copy_data = data.assign(**{col: data[col].map(_to_pg_array) for col in list_cols})
+
+	buffer = io.StringIO()
+	copy_data.to_csv(buffer, index=False, header=False, na_rep=_COPY_NULL)
+	buffer.seek(0)
+
+	columns = ', '.join(f'"{col}"' for col in data.columns)
+	statement = (
+		f'COPY "{settings.db_schema}"."{table_name}" ({columns}) '
+		f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+	)
+	cursor = session.connection().connection.cursor()
+	try:
+		cursor.copy_expert(statement, buffer)
+	finally:
+		cursor.close()
+
+
+def _insert_frame(session: Session, model_class, table_name: str, data: pd.DataFrame) -> None:
+	"""
+	Insert a cleaned dataframe, using COPY on Postgres and a bulk insert elsewhere.
+
+	Args:
+		session: Open session to insert with
+		model_class: SQLModel table class for the rows
+		table_name: Table to load into
+		data: Cleaned dataframe to insert
+	"""
+	if session.get_bind().dialect.driver == 'psycopg2':
+		_copy_to_postgres(session, table_name, data)
+	else:
+		session.bulk_insert_mappings(model_class, _to_sql_records(data))
+
 
 class DataProcessor:
 	"""
@@ -50,12 +227,23 @@ class DataProcessor:
 		"""
 		Read the CSV file specified during initialization.
 
+		Columns, dtypes and date formats for known data types are passed to the
+		parser, so dates and IDs arrive typed and need no second conversion pass.
+
 		Args:
-			**kwargs: Additional arguments to pass to pd.read_csv()
+			**kwargs: Additional arguments to pass to pd.read_csv(), overriding the defaults
 		"""
 		try:
 			logger.info(f'Reading CSV file: {self.file_path}')
-			self.raw_data = pd.read_csv(self.file_path, **kwargs)
+			options = {**_CSV_OPTIONS.get(self.data_type, {}), **kwargs}
+			if isinstance(options.get('parse_dates'), list):
+				# read_csv rejects date columns the file doesn't have, so only ask for the
+				# ones in its header; the cleaners skip any that are missing
+				header = pd.read_csv(self.file_path, nrows=0).columns
+				options['parse_dates'] = [
+					col for col in options['parse_dates'] if col in header
+				]
+			self.raw_data = pd.read_csv(self.file_path, **options)
 			logger.info(
 				f'Successfully loaded {len(self.raw_data)} rows and '
 				f'{len(self.raw_data.columns)} columns'
@@ -70,20 +258,23 @@ class DataProcessor:
 		Clean companies data according to the Company model.
 
 		Args:
-			data: Raw companies dataframe
+			data: Raw companies dataframe, modified in place
 		"""
 		logger.info('Cleaning companies data...')
-		cleaned = data.copy()
+		cleaned = data
 
 		# Map column names to match Company model
 		column_mapping = {
 			'company_id': 'id',
 		}
-		cleaned = cleaned.rename(columns=column_mapping)
+		cleaned.rename(columns=column_mapping, inplace=True)
 
 		# Convert datetime columns
 		if 'last_login' in cleaned.columns:
-			cleaned['last_login'] = pd.to_datetime(cleaned['last_login'], errors='coerce')
+			if not pd.api.types.is_datetime64_any_dtype(cleaned['last_login']):
+				cleaned['last_login'] = _fast_to_datetime(
+					cleaned['last_login'], errors='coerce', format=_ISO_DATETIME_FORMAT, utc=True
+				)
 			logger.info(
 				f'Converted last_login to datetime. '
 				f'Invalid dates: {cleaned["last_login"].isna().sum()}'
@@ -92,19 +283,20 @@ class DataProcessor:
 		# Data validation and cleaning
 		# Remove rows with missing critical fields
 		critical_fields = ['id', 'name', 'operating_jurisdiction', 'sector']
-		missing_critical = cleaned[critical_fields].isna().any(axis=1)
-		if missing_critical.any():
-			logger.warning(f'Removing {missing_critical.sum()} rows with missing critical fields')
-			cleaned = cleaned[~missing_critical]
+		rows_before = len(cleaned)
+		cleaned.dropna(subset=critical_fields, inplace=True)
+		dropped = rows_before - len(cleaned)
+		if dropped:
+			logger.warning(f'Removed {dropped} rows with missing critical fields')
 
 		# Clean text fields
-		text_fields = ['name', 'operating_jurisdiction', 'sector']
-		for field in text_fields:
-			if field in cleaned.columns:
-				cleaned[field] = cleaned[field].astype(str).str.strip()
+		text_fields = [field for field in _COMPANY_TEXT_FIELDS if field in cleaned.columns]
+		cleaned[text_fields] = (
+			cleaned[text_fields].astype('string').apply(lambda col: col.str.strip())
+		)
 
 		# Ensure ID is integer
-		if 'id' in cleaned.columns:
+		if 'id' in cleaned.columns and not pd.api.types.is_integer_dtype(cleaned['id']):
 			cleaned['id'] = pd.to_numeric(cleaned['id'], errors='coerce').astype('Int64')
 
 		logger.info(f'Companies data cleaned. Final shape: {cleaned.shape}')
@@ -115,82 +307,106 @@ class DataProcessor:
 		Clean policies data according to the Policy model.
 
 		Args:
-			data: Raw policies dataframe
+			data: Raw policies dataframe, modified in place
 		"""
 		logger.info('Cleaning policies data...')
-		cleaned = data.copy()
+		cleaned = data
 
-		cleaned = cleaned.rename(columns={'updated_date': 'updated_datetime'})
+		cleaned.rename(columns={'updated_date': 'updated_datetime'}, inplace=True)
 
 		# Convert date columns with different formats
 		if 'published_date' in cleaned.columns:
-			# Parse DD/MM/YY format
-			cleaned['published_date'] = pd.to_datetime(
-				cleaned['published_date'], errors='coerce', dayfirst=True
-			)
+			# Parse DD/MM/YYYY format unless read_csv already did
+			if not pd.api.types.is_datetime64_any_dtype(cleaned['published_date']):
+				cleaned['published_date'] = _fast_to_datetime(
+					cleaned['published_date'], errors='coerce', format=_PUBLISHED_DATE_FORMAT
+				)
 			invalid_count = cleaned['published_date'].isna().sum()
 			logger.info(
-				f'Converted published_date (DD/MM/YY): '
+				f'Converted published_date (DD/MM/YYYY): '
 				f'{len(cleaned) - invalid_count}/{len(cleaned)} successful'
 			)
 
-		if 'updated_date' in cleaned.columns:
-			# Parse ISO 8601 timestamps (2025-03-03T10:59:53.464Z)
-			cleaned['updated_date'] = pd.to_datetime(
-				cleaned['updated_date'], errors='coerce', utc=True
-			)
-			invalid_count = cleaned['updated_date'].isna().sum()
+		if 'updated_datetime' in cleaned.columns:
+			# Parse ISO 8601 timestamps (2025-03-03T10:59:53.464Z) unless read_csv already did
+			if not pd.api.types.is_datetime64_any_dtype(cleaned['updated_datetime']):
+				cleaned['updated_datetime'] = _fast_to_datetime(
+					cleaned['updated_datetime'],
+					errors='coerce',
+					format=_ISO_DATETIME_FORMAT,
+					utc=True,
+				)
+			invalid_count = cleaned['updated_datetime'].isna().sum()
 			logger.info(
-				f'Converted updated_date (ISO 8601): '
+				f'Converted updated_datetime (ISO 8601): '
 				f'{len(cleaned) - invalid_count}/{len(cleaned)} successful'
 			)
 
 		# Clean list fields (topics and sectors)
-		list_fields = ['topics', 'sectors']
-		for field in list_fields:
+		for field in _LIST_FIELDS:
 			if field in cleaned.columns:
-				cleaned[field] = cleaned[field].apply(self._parse_list_field)
+				cleaned[field] = self._parse_list_column(cleaned[field])
 				logger.info(f'Parsed {field} list field')
 
-		# Clean text fields
-		text_fields = ['name', 'description', 'geography', 'source_url', 'status']
-		for field in text_fields:
-			if field in cleaned.columns:
-				cleaned[field] = cleaned[field].astype(str).str.strip()
+		# Clean text fields; missing values stay missing instead of becoming 'nan'
+		text_fields = [field for field in _POLICY_TEXT_FIELDS if field in cleaned.columns]
+		cleaned[text_fields] = (
+			cleaned[text_fields].astype('string').apply(lambda col: col.str.strip())
+		)
 
 		# Clean HTML tags from description
 		if 'description' in cleaned.columns:
-			cleaned['description'] = cleaned['description'].str.replace(r'<[^<>]*>', '', regex=True)
-			cleaned['description'] = cleaned['description'].str.replace(r'&nbsp;', ' ', regex=True)
-			cleaned['description'] = cleaned['description'].str.strip()
+			cleaned['description'] = (
+				cleaned['description']
+				.str.replace(_HTML_RE, _html_replacement, regex=True)
+				.str.strip()
+			)
 
 		# Validate URLs
 		if 'source_url' in cleaned.columns:
-			url_pattern = r'^https?://'
-			invalid_urls = ~cleaned['source_url'].str.contains(url_pattern, case=False, na=False)
+			invalid_urls = ~cleaned['source_url'].str.contains(_URL_RE, na=False)
 			if invalid_urls.any():
 				logger.warning(f'Found {invalid_urls.sum()} rows with invalid URLs')
 
 		# Standardize status values
 		if 'status' in cleaned.columns:
-			status_mapping = {
-				'active': 'active',
-				'inactive': 'inactive',
-				'draft': 'draft',
-				'pending': 'pending',
-			}
-			cleaned['status'] = cleaned['status'].str.lower().map(status_mapping).fillna('unknown')
+			status = cleaned['status'].str.lower()
+			cleaned['status'] = np.where(status.isin(_VALID_STATUSES), status, 'unknown')
 
 		# Remove rows with missing critical fields
 		critical_fields = ['id', 'name', 'geography']
-		missing_critical = cleaned[critical_fields].isna().any(axis=1)
-		if missing_critical.any():
-			logger.warning(f'Removing {missing_critical.sum()} rows with missing critical fields')
-			cleaned = cleaned[~missing_critical]
+		rows_before = len(cleaned)
+		cleaned.dropna(subset=critical_fields, inplace=True)
+		dropped = rows_before - len(cleaned)
+		if dropped:
+			logger.warning(f'Removed {dropped} rows with missing critical fields')
 
 		logger.info(f'Policies data cleaned. Final shape: {cleaned.shape}')
 		return cleaned
 
+	def _parse_list_column(self, series: pd.Series) -> pd.Series:
+		"""
+		Parse a column of list fields, using vectorized string operations where possible.
+
+		Values that are plain comma-separated strings or simple quoted list literals are
+		split with a single findall over the column. Anything else (missing values,
+		nested or tuple literals, quoted items containing commas) goes through
+		_parse_list_field row by row.
+
+		Args:
+			series: Column of list values to parse
+		"""
+		if not (series.dtype == object or isinstance(series.dtype, pd.StringDtype)):
+			return series.apply(self._parse_list_field)
+
+		simple = series.str.fullmatch(_SIMPLE_LIST_RE, na=False).astype(bool)
+		parsed = series[simple].str.findall(_LIST_ITEM_RE).astype(object)
+		if simple.all():
+			return parsed
+
+		irregular = series[~simple].apply(self._parse_list_field)
+		return pd.concat([parsed, irregular]).reindex(series.index)
+
 	def _parse_list_field(self, value) -> list[str]:
 		"""
 		Parse list fields that might be stored as strings.
@@ -198,48 +414,68 @@ class DataProcessor:
 		Args:
 			value: Value to parse (could be string representation of list or actual list)
 		"""
+		if isinstance(value, list):
+			return [text for text in (str(item).strip() for item in value) if text]
+
 		if pd.isna(value) or value == '':
 			return []
 
-		if isinstance(value, list):
-			return [str(item).strip() for item in value if str(item).strip()]
-
 		if isinstance(value, str):
+			# Plain comma-separated values don't need the Python parser
+			if value[:1] not in ('[', '('):
+				return [text for text in (item.strip() for item in value.split(',')) if text]
+
 			try:
 				# Try to parse as literal list
 				parsed = ast.literal_eval(value)
 				if isinstance(parsed, list):
-					return [str(item).strip() for item in parsed if str(item).strip()]
+					return [text for text in (str(item).strip() for item in parsed) if text]
 				else:
 					return [str(parsed).strip()] if str(parsed).strip() else []
 			except (ValueError, SyntaxError):
 				# If that fails, treat as comma-separated string
-				items = [item.strip() for item in value.split(',')]
-				return [item for item in items if item]
+				return [text for text in (item.strip() for item in value.split(',')) if text]
 
 		return [str(value).strip()] if str(value).strip() else []
 
-	def clean_data(self) -> pd.DataFrame:
+	def _clean_frame(self, data: pd.DataFrame) -> pd.DataFrame | None:
+		"""
+		Clean a dataframe with the cleaner for the detected data type.
+
+		Args:
+			data: Raw dataframe (or chunk of one) to clean
+		"""
+		if self.data_type == 'companies':
+			return self._clean_companies_data(data)
+		elif self.data_type == 'policies':
+			return self._clean_policies_data(data)
+
+		logger.warning(f'Unknown data type: {self.data_type}.')
+		return None
+
+	def clean_data(self, keep_raw: bool = False) -> pd.DataFrame:
 		"""
 		Clean the loaded data based on the detected data type and corresponding models.
+
+		The raw data is cleaned in place and released afterwards to avoid holding two
+		copies of the file in memory.
+
+		Args:
+			keep_raw: Clean a copy instead and keep raw_data available afterwards
 		"""
 		if self.raw_data is None:
 			raise ValueError('No data loaded. Please call read_csv() first.')
 
 		logger.info('Starting data cleaning process...')
 
-		if self.data_type == 'companies':
-			self.cleaned_data = self._clean_companies_data(self.raw_data)
-		elif self.data_type == 'policies':
-			self.cleaned_data = self._clean_policies_data(self.raw_data)
-		else:
-			logger.warning(f'Unknown data type: {self.data_type}.')
-			self.cleaned_data = None
+		original_shape = self.raw_data.shape
+		data = self.raw_data.copy() if keep_raw else self.raw_data
+		self.cleaned_data = self._clean_frame(data)
+		if not keep_raw:
+			self.raw_data = None
 
 		logger.info('Data cleaning completed')
-		logger.info(
-			f'Original shape: {self.raw_data.shape}, Cleaned shape: {self.cleaned_data.shape}'
-		)
+		logger.info(f'Original shape: {original_shape}, Cleaned shape: {self.cleaned_data.shape}')
 		return self.cleaned_data
 
 	def validate_and_create_models(self) -> dict[str, any]:
@@ -258,38 +494,52 @@ class DataProcessor:
 
 		self.pydantic_models = []  # Reset models list
 
+		adapter = _VALIDATORS.get(self.data_type)
+		if adapter is None:
+			logger.warning(f'No validation model for data type: {self.data_type}')
+			return validation_results
+
+		# Validate the whole batch in one call to the pydantic core
+		records = _to_sql_records(self.cleaned_data)
 		try:
-			if self.data_type == 'companies':
-				for idx, row in self.cleaned_data.iterrows():
-					try:
-						model = Company(**row.to_dict())
-						self.pydantic_models.append(model)
-						validation_results['valid_rows'] += 1
-					except Exception as e:
-						validation_results['invalid_rows'] += 1
-						validation_results['validation_errors'].append(f'Row {idx}: {str(e)}')
-
-			elif self.data_type == 'policies':
-				for idx, row in self.cleaned_data.iterrows():
-					try:
-						model = Policy(**row.to_dict())
-						# print(row.to_dict())
-						# print(model)
-						self.pydantic_models.append(model)
-						validation_results['valid_rows'] += 1
-					except Exception as e:
-						validation_results['invalid_rows'] += 1
-						validation_results['validation_errors'].append(f'Row {idx}: {str(e)}')
-
-		except ImportError:
-			validation_results['validation_errors'].append('Could not import models for validation')
+			self.pydantic_models = adapter.validate_python(records)
+		except ValidationError as e:
+			# Group errors by row position, then revalidate only the valid rows
+			row_errors: dict[int, list[str]] = {}
+			for error in e.errors():
+				position, *field = error['loc']
+				location = '.'.join(str(part) for part in field)
+				row_errors.setdefault(position, []).append(f'{location}: {error["msg"]}')
+
+			for position, messages in row_errors.items():
+				idx = self.cleaned_data.index[position]
+				validation_results['validation_errors'].append(f'Row {idx}: {"; ".join(messages)}')
+
+			valid_records = [
+				record for position, record in enumerate(records) if position not in row_errors
+			]
+			self.pydantic_models = adapter.validate_python(valid_records)
+
+		validation_results['valid_rows'] = len(self.pydantic_models)
+		validation_results['invalid_rows'] = len(records) - len(self.pydantic_models)
 
 		logger.info(f'Created {len(self.pydantic_models)} valid pydantic models')
 		return validation_results
 
+	def _get_sql_target(self) -> tuple[str, type[Company] | type[Policy]]:
+		"""
+		Get the table name and model class for the detected data type.
+		"""
+		if self.data_type == 'companies':
+			return settings.companies_table, Company
+		elif self.data_type == 'policies':
+			return settings.policies_table, Policy
+		else:
+			raise ValueError(f'Unknown data type: {self.data_type}')
+
 	def load_to_sql(self) -> None:
 		"""
-		Load the cleaned data to SQL database using SQLModel objects and session.add.
+		Load the cleaned data to SQL database with a single bulk load per table.
 
 		Args:
 			if_exists: How to behave if data exists ('replace', 'append')
@@ -297,24 +547,10 @@ class DataProcessor:
 		if self.cleaned_data is None:
 			raise ValueError('No cleaned data available. Please clean data first.')
 
-		# Get table name and model class based on data type
-		if self.data_type == 'companies':
-			table_name = settings.companies_table
-			model_class = Company
-		elif self.data_type == 'policies':
-			table_name = settings.policies_table
-			model_class = Policy
-		else:
-			raise ValueError(f'Unknown data type: {self.data_type}')
+		table_name, model_class = self._get_sql_target()
 
 		try:
-			# Create database engine
-			engine = create_engine(
-				settings.database_url,
-				pool_size=settings.db_pool_size,
-				max_overflow=settings.db_max_overflow,
-				echo=False,
-			)
+			engine = get_engine()
 
 			logger.info(f'Loading data to SQL table: {settings.db_schema}.{table_name}')
 
@@ -324,50 +560,69 @@ class DataProcessor:
 				logger.info(f'Clearing existing data from {table_name}')
 				statement = delete(model_class)
 				session.exec(statement)
-				session.commit()
 				logger.info(f'Cleared existing data from {table_name}')
 
-				# Create SQLModel objects and add to session
-				created_objects = []
-				for idx, row in self.cleaned_data.iterrows():
-					try:
-						# Convert row to dict and create SQLModel object
-						row_dict = row.to_dict()
-
-						# Handle None values for nullable fields
-						for key, value in row_dict.items():
-							# Handle different data types properly
-							if isinstance(value, list):
-								# For lists, keep as-is (they're already processed)
-								continue
-							elif pd.isna(value):
-								# For scalar values, convert NaN to None
-								row_dict[key] = None
-
-						db_object = model_class(**row_dict)
-						print(db_object.updated_datetime)
-						session.add(db_object)
-						created_objects.append(db_object)
-
-					except Exception as e:
-						logger.error(f'Error creating object for row {idx}: {e}')
-						logger.error(f'Row data: {row_dict}')
-						raise
-
-				# Commit all objects to database
-				logger.info(f'Committing {len(created_objects)} objects to database')
+				# Insert all rows in one batch, replacing the old rows atomically
+				row_count = len(self.cleaned_data)
+				logger.info(f'Committing {row_count} rows to database')
+				_insert_frame(session, model_class, table_name, self.cleaned_data)
 				session.commit()
 
-				logger.info(f'Successfully loaded {len(created_objects)} rows to {table_name}')
+				logger.info(f'Successfully loaded {row_count} rows to {table_name}')
 
-				# Verify the data was loaded
-				count_result = session.query(model_class).count()
-				logger.info(f'Verification: {count_result} rows now in {table_name} table')
+				# Verify the data was loaded; skipped when the log line would be dropped anyway
+				if logger.isEnabledFor(logging.INFO):
+					count_query = select(func.count()).select_from(model_class)
+					count_result = session.exec(count_query).one()
+					logger.info(f'Verification: {count_result} rows now in {table_name} table')
 
 		except Exception as e:
 			logger.error(f'Error loading data to SQL: {e}')
 			raise
 
+	def process_to_sql(self, chunksize: int = 200_000) -> int:
+		"""
+		Stream the CSV file into the SQL database without holding it all in memory.
+
+		The file is read in chunks; each chunk is cleaned, bulk inserted and committed
+		before the next one is read. Neither raw_data nor cleaned_data is populated.
+
+		Args:
+			chunksize: Number of CSV rows to read, clean and insert at a time
+
+		Returns:
+			Total number of rows loaded
+		"""
+		table_name, model_class = self._get_sql_target()
+		options = _CSV_OPTIONS.get(self.data_type, {})
+
+		try:
+			engine = get_engine()
+
+			logger.info(
+				f'Streaming {self.file_path} to SQL table: {settings.db_schema}.{table_name}'
+			)
+
+			total_rows = 0
+			with Session(engine) as session:
+				logger.info(f'Clearing existing data from {table_name}')
+				session.exec(delete(model_class))
+
+				with pd.read_csv(self.file_path, chunksize=chunksize, **options) as reader:
+					for chunk in reader:
+						cleaned = self._clean_frame(chunk)
+						_insert_frame(session, model_class, table_name, cleaned)
+						session.commit()
+						total_rows += len(cleaned)
+						logger.info(f'Loaded {total_rows} rows to {table_name} so far')
+
+			logger.info(f'Successfully loaded {total_rows} rows to {table_name}')
+			return total_rows
+
+		except Exception as e:
+			logger.error(f'Error streaming data to SQL: {e}')
+			raise
+
 	def save_cleaned_data(
 		self, output_path: str | Path, file_format: str = 'csv', **kwargs
 	) -> None:
@@ -377,7 +632,8 @@ class DataProcessor:
 		Args:
 			output_path: Path to save the cleaned data
 			file_format: Format to save ('csv', 'excel', 'json')
-			**kwargs: Additional arguments for the save method
+			**kwargs: Additional arguments for the save method (CSVs written with
+				kwargs always use pandas rather than the pyarrow writer)
 		"""
 		if self.cleaned_data is None:
 			raise ValueError('No cleaned data available. Please clean data first.')
@@ -385,7 +641,9 @@ class DataProcessor:
 		output_path = Path(output_path)
 
 		try:
-			if file_format.lower() == 'csv':
+			if file_format.lower() == 'csv' and not kwargs:
+				self._write_csv_arrow(output_path)
+			elif file_format.lower() == 'csv':
 				self.cleaned_data.to_csv(output_path, index=False, **kwargs)
 			elif file_format.lower() == 'excel':
 				self.cleaned_data.to_excel(output_path, index=False, **kwargs)
@@ -398,3 +656,27 @@ class DataProcessor:
 		except Exception as e:
 			logger.error(f'Error saving cleaned data: {e}')
 			raise
+
+	def _write_csv_arrow(self, output_path: Path) -> None:
+		"""
+		Write the cleaned data to CSV with pyarrow's multithreaded writer.
+
+		Ranking reads the file back without parsing, so columns Arrow would format
+		differently from pandas.to_csv are stringified first: list columns in their Python
+		repr (Arrow's CSV writer has no list type support) and datetimes in pandas' format
+		(date-only when there is no time component, offsets as +00:00).
+
+		Args:
+			output_path: Path to save the cleaned data
+		"""
+		data = self.cleaned_data
+		list_cols = [col for col in _LIST_FIELDS if col in data.columns]
+		datetime_cols = data.select_dtypes(include=['datetime', 'datetimetz']).columns
+		data = data.assign(
+			**{col: data[col].map(str) for col in list_cols},
+			**{col: data[col].astype(str).where(data[col].notna()) for col in datetime_cols},
+		)
+		table = pa.Table.from_pandas(data, preserve_index=False)
+		pa_csv.write_csv(
+			table, str(output_path), write_options=pa_csv.WriteOptions(quoting_style='needed')
+		)
@@ -0,0 +1,25 @@
+"""
+Database Engine
+
+Provides a single shared SQLModel engine so every component reuses the same
+connection pool.
+"""
+
+from functools import lru_cache
+
+from sqlalchemy.engine import Engine
+from sqlmodel import create_engine
+
+from .settings import settings
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+	"""Get the shared database engine, creating it on first use."""
+	return create_engine(
+		settings.database_url,
+		pool_size=settings.db_pool_size,
+		max_overflow=settings.db_max_overflow,
+		pool_pre_ping=True,
+		echo=False,
+	)
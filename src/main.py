@@ -1,75 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from .data_processor import DataProcessor
+from .db import get_engine
 from .policy_query import PolicyQueryService
 from .ranking import print_policy_ranking_report
 
+# (label, raw data file, cleaned output file) for each dataset to process
+DATASETS = [
+    ('companies', 'src/data/companies.csv', 'src/data/cleaned_companies.csv'),
+    ('policies', 'src/data/policies.csv', 'src/data/cleaned_policies.csv'),
+]
 
-def main():
-    try:
-        # Create a DataProcessor instance for companies data
-        companies_processor = DataProcessor('src/data/companies.csv')
-
-        # Read and process companies data
-        companies_processor.read_csv()
-        # Clean companies data
-        companies_processor.clean_data()
-        # Validate and create pydantic models
-        companies_validation = companies_processor.validate_and_create_models()
-        print('Validation Results:')
-        print(f'   Valid rows: {companies_validation["valid_rows"]}')
-        print(f'   Invalid rows: {companies_validation["invalid_rows"]}')
-        print(f'   Pydantic models created: {len(companies_processor.pydantic_models)}')
-
-        if companies_validation['validation_errors']:
-            print(f'   Sample errors: {companies_validation["validation_errors"][:3]}')
-
-        # Save cleaned companies data
-        companies_processor.save_cleaned_data('src/data/cleaned_companies.csv')
-
-        # Load to SQL
-        print('🔄 Loading companies data to SQL database...')
-        print(f'   Data shape before loading: {companies_processor.cleaned_data.shape}')
-        companies_processor.load_to_sql()
-        print('✅ Companies data loaded to SQL successfully!')
 
-    except Exception as e:
-        print(f'❌ Error processing companies data: {e}')
+def process_dataset(data_path: str, cleaned_path: str) -> dict:
+    """
+    Run the read -> clean -> validate -> save -> load pipeline for one data file.
 
-    print('\n' + '=' * 80)
+    Args:
+        data_path: Path to the raw CSV file
+        cleaned_path: Path to save the cleaned CSV to
 
-    # Process Policies Data
-    print('\n📋 PROCESSING POLICIES DATA')
-    print('-' * 50)
+    Returns:
+        Summary of the run for reporting
+    """
+    processor = DataProcessor(data_path)
 
-    try:
-        # Create a new DataProcessor instance for policies data
-        policies_processor = DataProcessor('src/data/policies.csv')
+    raw_shape = processor.read_csv().shape
+    cleaned_shape = processor.clean_data().shape
+    validation = processor.validate_and_create_models()
+    processor.save_cleaned_data(cleaned_path)
+    processor.load_to_sql()
 
-        # Read and process policies data
-        policies_data = policies_processor.read_csv()
-        print(f'📥 Raw data shape: {policies_data.shape}')
+    return {
+        'raw_shape': raw_shape,
+        'cleaned_shape': cleaned_shape,
+        'validation': validation,
+        'model_count': len(processor.pydantic_models),
+    }
 
-        # Clean policies data
-        cleaned_policies = policies_processor.clean_data()
-        print(f'🧹 Cleaned data shape: {cleaned_policies.shape}')
 
-        # Validate and create pydantic models
-        policies_validation = policies_processor.validate_and_create_models()
-        print('\n✅ Validation Results:')
-        print(f'   Valid rows: {policies_validation["valid_rows"]}')
-        print(f'   Invalid rows: {policies_validation["invalid_rows"]}')
-        print(f'   Pydantic models created: {len(policies_processor.pydantic_models)}')
+def print_dataset_summary(label: str, summary: dict) -> None:
+    """
+    Print the results of processing one dataset.
 
-        # Save cleaned policies data
-        policies_processor.save_cleaned_data('src/data/cleaned_policies.csv')
+    Args:
+        label: Name of the dataset
+        summary: Summary returned by process_dataset
+    """
+    validation = summary['validation']
+    print(f'📥 Raw data shape: {summary["raw_shape"]}')
+    print(f'🧹 Cleaned data shape: {summary["cleaned_shape"]}')
+    print('\n✅ Validation Results:')
+    print(f'   Valid rows: {validation["valid_rows"]}')
+    print(f'   Invalid rows: {validation["invalid_rows"]}')
+    print(f'   Pydantic models created: {summary["model_count"]}')
 
-        # Load to SQL
-        print('🔄 Loading policies data to SQL database...')
-        print(f'   Data shape before loading: {policies_processor.cleaned_data.shape}')
-        policies_processor.load_to_sql()
-        print('✅ Policies data loaded to SQL successfully!')
+    if validation['validation_errors']:
+        print(f'   Sample errors: {validation["validation_errors"][:3]}')
 
-    except Exception as e:
-        print(f'❌ Error processing policies data: {e}')
+    print(f'✅ {label.capitalize()} data loaded to SQL successfully!')
+
+
+def main():
+    # Create the shared engine up front so both pipelines reuse the same pool
+    get_engine()
+
+    # The datasets are independent, so run their pipelines concurrently; most of the
+    # time is spent in file and database I/O, which releases the GIL
+    with ThreadPoolExecutor(max_workers=len(DATASETS)) as executor:
+        futures = [
+            (label, executor.submit(process_dataset, data_path, cleaned_path))
+            for label, data_path, cleaned_path in DATASETS
+        ]
+
+        for label, future in futures:
+            print(f'\n📋 PROCESSING {label.upper()} DATA')
+            print('-' * 50)
+            try:
+                print_dataset_summary(label, future.result())
+            except Exception as e:
+                print(f'❌ Error processing {label} data: {e}')
+
+            print('\n' + '=' * 80)
 
     query_service = PolicyQueryService()
 
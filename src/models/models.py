@@ -5,10 +5,8 @@ from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Column, Field, SQLModel
 
 
-# SQLModel table definitions for database
-class Company(SQLModel, table=True):
-	__tablename__ = 'companies'
-
+# Pydantic models used to validate cleaned data (table models skip validation)
+class CompanyBase(SQLModel):
 	id: int = Field(primary_key=True, nullable=False)
 	name: str = Field(nullable=False)
 	operating_jurisdiction: str = Field(nullable=False)
@@ -16,16 +14,26 @@ class Company(SQLModel, table=True):
 	sector: str = Field(nullable=False)
 
 
-class Policy(SQLModel, table=True):
-	__tablename__ = 'policies'
-
+class PolicyBase(SQLModel):
 	id: str = Field(primary_key=True, nullable=False)
 	name: str = Field(nullable=False)
 	published_date: datetime | None = Field(default=None, nullable=True)
 	description: str | None = Field(default=None, nullable=True)
 	geography: str = Field(nullable=False)
 	source_url: str | None = Field(default=None, nullable=True)
-	topics: list[str] | None = Field(default=None, sa_column=Column(ARRAY(String), nullable=True))
-	sectors: list[str] | None = Field(default=None, sa_column=Column(ARRAY(String), nullable=True))
+	topics: list[str] | None = Field(default=None)
+	sectors: list[str] | None = Field(default=None)
 	status: str | None = Field(default=None, nullable=True)
 	updated_datetime: datetime | None = Field(default=None, nullable=True)
+
+
+# SQLModel table definitions for database
+class Company(CompanyBase, table=True):
+	__tablename__ = 'companies'
+
+
+class Policy(PolicyBase, table=True):
+	__tablename__ = 'policies'
+
+	topics: list[str] | None = Field(default=None, sa_column=Column(ARRAY(String), nullable=True))
+	sectors: list[str] | None = Field(default=None, sa_column=Column(ARRAY(String), nullable=True))
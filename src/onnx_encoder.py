@@ -0,0 +1,83 @@
+"""
+ONNX Sentence Encoder
+
+Runs the INT8-quantized MiniLM export from scripts/export_minilm.py with ONNX Runtime, as a
+drop-in for the parts of SentenceTransformer.encode used by the ranking code.
+"""
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+except ImportError:  # onnxruntime is optional; ranking then uses sentence-transformers
+    ort = None
+    AutoTokenizer = None
+
+# File written by ORTQuantizer.quantize into the export directory
+QUANTIZED_MODEL_FILE = 'model_quantized.onnx'
+
+
+class OnnxSentenceEncoder:
+    """Mean-pooled sentence embeddings from an ONNX Runtime session."""
+
+    def __init__(self, model_dir: Path, max_seq_length: int = 256):
+        """
+        Load the tokenizer and quantized model from an export directory.
+
+        Args:
+            model_dir: Directory written by scripts/export_minilm.py
+            max_seq_length: Longest token sequence to encode (MiniLM's own limit is 256)
+        """
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.session = ort.InferenceSession(
+            str(model_dir / QUANTIZED_MODEL_FILE), providers=['CPUExecutionProvider']
+        )
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        self.max_seq_length = max_seq_length
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Embed sentences, mirroring SentenceTransformer.encode with NumPy output.
+
+        Args:
+            sentences: Texts to embed
+            batch_size: Number of texts per forward pass
+            normalize_embeddings: Whether to L2-normalize the embeddings
+            **kwargs: Other SentenceTransformer.encode options, ignored (output is always a
+                NumPy array and there is no progress bar)
+
+        Returns:
+            Array of float32 embeddings, one row per sentence
+        """
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            tokens = self.tokenizer(
+                list(sentences[start : start + batch_size]),
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors='np',
+            )
+            inputs = {name: tokens[name].astype(np.int64) for name in self.input_names}
+            token_embeddings = self.session.run(None, inputs)[0]
+
+            # Mean pooling over real (non-padding) tokens, as in the sentence-transformers model
+            mask = tokens['attention_mask'][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            batches.append(summed / np.clip(mask.sum(axis=1), 1e-9, None))
+
+        embeddings = np.concatenate(batches).astype(np.float32, copy=False)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.clip(norms, 1e-12, None)
+        return embeddings
@@ -7,18 +7,18 @@ and calculate geography-based update statistics using SQLModel ORM.
 
 from datetime import datetime, timedelta
 
-from sqlmodel import Session, and_, create_engine, func, select
+from sqlmodel import Session, and_, func, select
 
+from .db import get_engine
 from .models.models import Policy
-from .settings import settings
 
 
 class PolicyQueryService:
 	"""Service for executing complex policy queries using SQLModel ORM."""
 
 	def __init__(self):
-		"""Initialize the service with database connection."""
-		self.engine = create_engine(settings.database_url)
+		"""Initialize the service with the shared database engine."""
+		self.engine = get_engine()
 
 	def get_policies_with_avg_update_time(self, customer_jurisdiction: str) -> list:
 		"""
@@ -30,47 +30,40 @@ class PolicyQueryService:
 		one_year_ago = datetime.now() - timedelta(days=365)
 
 		with Session(self.engine) as session:
-			# Subquery: Average days since last update for same geography (past year)
-			avg_days_subquery = (
+			# Policies in the customer's geography updated in the past year, each carrying
+			# the geography's average days since update as a window aggregate
+			geography_policies = (
 				select(
+					Policy.id,
+					Policy.name,
 					Policy.geography,
-					func.avg(
-						func.extract('epoch', func.now() - Policy.updated_datetime) / 86400
-					).label('avg_days_since_update'),
+					Policy.updated_datetime,
+					Policy.status,
+					func.avg(func.extract('epoch', func.now() - Policy.updated_datetime) / 86400)
+					.over(partition_by=Policy.geography)
+					.label('avg_days_since_update'),
 				)
 				.where(
 					and_(
+						# Match customer's operating jurisdiction (using geography field)
+						Policy.geography == customer_jurisdiction,
 						Policy.updated_datetime >= one_year_ago,
 						Policy.updated_datetime.is_not(None),
 					)
 				)
-				.group_by(Policy.geography)
 				.subquery()
 			)
 
-			# Main query with join to get policies and their geography average
+			# Narrow down to active policies updated in last 90 days
 			query = (
-				select(
-					Policy.id,
-					Policy.name,
-					Policy.geography,
-					Policy.updated_datetime,
-					Policy.status,
-					avg_days_subquery.c.avg_days_since_update,
-				)
-				.join(avg_days_subquery, Policy.geography == avg_days_subquery.c.geography)
+				select(geography_policies)
 				.where(
 					and_(
-						# Match customer's operating jurisdiction (using geography field)
-						Policy.geography == customer_jurisdiction,
-						# Only active policies
-						Policy.status == 'active',
-						# Updated in last 90 days
-						Policy.updated_datetime >= ninety_days_ago,
-						Policy.updated_datetime.is_not(None),
+						geography_policies.c.status == 'active',
+						geography_policies.c.updated_datetime >= ninety_days_ago,
 					)
 				)
-				.order_by(Policy.updated_datetime.desc())
+				.order_by(geography_policies.c.updated_datetime.desc())
 			)
 
 			return session.exec(query).all()
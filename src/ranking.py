@@ -1,10 +1,266 @@
+import functools
+import hashlib
+import logging
+import os
+from pathlib import Path
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import torch
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
-from .utils import get_continent, parse_sector_list
+from .onnx_encoder import OnnxSentenceEncoder, ort
+from .utils import add_policy_ranking_columns, get_continent
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = 'all-MiniLM-L6-v2'  # Lightweight but effective model
+
+COMPANIES_PATH = Path('src/data/cleaned_companies.csv')
+POLICIES_PATH = Path('src/data/cleaned_policies.csv')
+
+# Cleaned policies with precomputed ranking columns, see scripts/build_cleaned_policies.py
+POLICIES_PARQUET_PATH = POLICIES_PATH.with_suffix('.parquet')
+
+# INT8-quantized ONNX export of the model, see scripts/export_minilm.py
+ONNX_MODEL_DIR = Path(f'src/data/onnx/{MODEL_NAME}-int8')
+
+# Policy sector embeddings persisted across runs, keyed by sha256 of the sector text
+# (quantized and half-precision embeddings differ slightly, so each has its own cache)
+EMBEDDING_CACHE_PATH = Path(f'src/data/policy_embeddings_{MODEL_NAME}.npz')
+FP16_EMBEDDING_CACHE_PATH = Path(f'src/data/policy_embeddings_{MODEL_NAME}-fp16.npz')
+ONNX_EMBEDDING_CACHE_PATH = Path(f'src/data/policy_embeddings_{MODEL_NAME}-onnx-int8.npz')
+
+
+@functools.lru_cache(maxsize=2)
+def _load_table(path: Path) -> pd.DataFrame:
+    """
+    Load a cleaned data file once per process, from a parquet copy when one is up to date.
+
+    The CSV is converted to parquet (next to it) the first time it is read, so later runs
+    skip CSV parsing. The returned DataFrame is shared between callers and must not be
+    modified in place.
+
+    Args:
+        path: Path to the cleaned CSV file
+
+    Returns:
+        DataFrame with the file contents
+    """
+    parquet_path = path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= path.stat().st_mtime:
+        return pd.read_parquet(parquet_path, engine='pyarrow')
+
+    df = pd.read_csv(path)
+    try:
+        # Write to a temp file and swap it in, so concurrent readers never see a partial file
+        tmp_path = parquet_path.with_name(parquet_path.name + '.tmp')
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, parquet_path)
+    except OSError as e:
+        # The data directory may be read-only; the CSV is then parsed once per process
+        logger.debug(f'Not caching {path} as parquet: {e}')
+    return df
+
+
+@functools.lru_cache(maxsize=1)
+def _load_companies() -> pd.DataFrame:
+    """
+    Load the cleaned companies once per process, ready for name lookups.
+
+    Returns:
+        DataFrame of companies, with an Arrow-backed name column so substring searches run
+        in Arrow's compute kernels
+    """
+    companies_df = _load_table(COMPANIES_PATH)
+    return companies_df.assign(name=companies_df['name'].astype('string[pyarrow]'))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_policies() -> pd.DataFrame:
+    """
+    Load the cleaned policies with their ranking columns once per process.
+
+    Uses the parquet written by scripts/build_cleaned_policies.py when it is up to date,
+    otherwise derives the ranking columns from the cleaned CSV. The returned DataFrame is
+    shared between callers and must not be modified in place.
+
+    Returns:
+        DataFrame of policies with parsed_sectors, sector_text and continent columns
+    """
+    if (
+        POLICIES_PARQUET_PATH.exists()
+        and POLICIES_PARQUET_PATH.stat().st_mtime >= POLICIES_PATH.stat().st_mtime
+    ):
+        table = pq.read_table(POLICIES_PARQUET_PATH)
+        if 'parsed_sectors' in table.column_names:
+            # Keep list columns Arrow-backed so each value comes back as a plain list
+            return table.to_pandas(
+                types_mapper=lambda t: pd.ArrowDtype(t) if pa.types.is_list(t) else None
+            )
+
+    return add_policy_ranking_columns(pd.read_csv(POLICIES_PATH))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model() -> SentenceTransformer | OnnxSentenceEncoder:
+    """
+    Load the sentence transformer model once per process.
+
+    Returns:
+        Shared model instance: the quantized ONNX export when it exists and onnxruntime is
+        installed, otherwise the PyTorch model (in half precision on the GPU when available)
+    """
+    if ort is not None and ONNX_MODEL_DIR.exists():
+        return OnnxSentenceEncoder(ONNX_MODEL_DIR)
+
+    if torch.cuda.is_available():
+        # FP16 halves memory traffic and uses tensor cores; ranking tolerates the precision
+        return SentenceTransformer(MODEL_NAME, device='cuda').half()
+
+    return SentenceTransformer(MODEL_NAME, device='cpu')
+
+
+def _embedding_cache_path(model: SentenceTransformer | OnnxSentenceEncoder) -> Path:
+    """
+    Pick the embedding cache file matching the model's backend and precision.
+
+    Args:
+        model: Model returned by _get_model
+
+    Returns:
+        Path to the .npz embedding cache
+    """
+    if isinstance(model, OnnxSentenceEncoder):
+        return ONNX_EMBEDDING_CACHE_PATH
+    if next(model.parameters()).dtype == torch.float16:
+        return FP16_EMBEDDING_CACHE_PATH
+    return EMBEDDING_CACHE_PATH
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_company(company_sector: str) -> np.ndarray:
+    """
+    Embed a company sector, reusing the result for repeated lookups of the same sector.
+
+    Args:
+        company_sector: Company sector text
+
+    Returns:
+        Read-only, L2-normalized float32 embedding
+    """
+    embedding = _get_model().encode([company_sector], normalize_embeddings=True)[0]
+    embedding = embedding.astype(np.float32)
+    embedding.setflags(write=False)
+    return embedding
+
+
+@functools.lru_cache(maxsize=3)
+def _load_embedding_cache(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Load cached sector embeddings from disk once per process.
+
+    The returned dictionary is shared between calls; new embeddings are added to it in
+    place, so later calls see them without reloading the file.
+
+    Args:
+        path: Path to the .npz embedding cache
+
+    Returns:
+        Dictionary mapping sector text hashes to embeddings (empty if no cache yet)
+    """
+    if not path.exists():
+        return {}
+
+    with np.load(path) as cache:
+        return dict(zip(cache['keys'].tolist(), cache['embeddings']))
+
+
+def _save_embedding_cache(path: Path, cache: Dict[str, np.ndarray]) -> None:
+    """
+    Atomically write sector embeddings to disk, skipping the write if it fails.
+
+    Args:
+        path: Path to the .npz embedding cache
+        cache: Dictionary mapping sector text hashes to embeddings
+    """
+    try:
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, keys=np.array(list(cache)), embeddings=np.stack(list(cache.values())))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # The data directory may be read-only; the embeddings stay cached in memory
+        logger.debug(f'Not saving policy embeddings to {path}: {e}')
+
+
+def _encode_policy_sectors(
+    model: SentenceTransformer | OnnxSentenceEncoder, policy_sectors: List[str]
+) -> np.ndarray:
+    """
+    Embed policy sector texts, only running the model for texts not already cached.
+
+    Args:
+        model: Sentence transformer model to encode with
+        policy_sectors: Sector text for each policy
+
+    Returns:
+        Array of embeddings, one row per policy in input order
+    """
+    cache_path = _embedding_cache_path(model)
+    cache = _load_embedding_cache(cache_path)
+
+    # Many policies share the same sector text, so only hash and encode each distinct text
+    unique_texts, inverse = np.unique(np.asarray(policy_sectors, dtype=str), return_inverse=True)
+    unique_texts = unique_texts.tolist()
+    keys = [hashlib.sha256(text.encode()).hexdigest() for text in unique_texts]
+
+    misses = [(key, text) for key, text in zip(keys, unique_texts) if key not in cache]
+    if misses:
+        miss_keys, miss_texts = zip(*misses)
+
+        # Encode in length order so each batch pads to similar lengths, then restore order
+        order = np.argsort([len(text) for text in miss_texts], kind='stable')
+        sorted_embeddings = model.encode(
+            [miss_texts[i] for i in order],
+            batch_size=64,
+            convert_to_tensor=False,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        miss_embeddings = np.empty_like(sorted_embeddings, dtype=np.float32)
+        miss_embeddings[order] = sorted_embeddings
+
+        cache.update(zip(miss_keys, miss_embeddings))
+        _save_embedding_cache(cache_path, cache)
+
+    return np.stack([cache[key] for key in keys], dtype=np.float32)[inverse.ravel()]
+
+
+def _top_k_positions(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Find the positions of the k highest scores without sorting the whole array.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of positions to return
+
+    Returns:
+        Positions of the top k scores, highest first (ties keep their original order)
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= len(scores):
+        return np.argsort(-scores, kind='stable')
+
+    # np.partition finds the k-th highest score in O(n); keeping every score tied with it
+    # before sorting makes ties resolve by row position, so results agree across limits
+    kth_score = np.partition(scores, len(scores) - k)[len(scores) - k]
+    candidates = np.flatnonzero(scores >= kth_score)
+    return candidates[np.argsort(-scores[candidates], kind='stable')[:k]]
 
 
 def get_top_relevant_policies_rag(company_name: str, limit: int = 3) -> List[Dict]:
@@ -20,9 +276,9 @@ def get_top_relevant_policies_rag(company_name: str, limit: int = 3) -> List[Dic
     Returns:
         List of dictionaries containing policy details and relevance scores
     """
-    # Read the data files
-    companies_df = pd.read_csv('src/data/cleaned_companies.csv')
-    policies_df = pd.read_csv('src/data/cleaned_policies.csv')
+    # Load the data files (cached per process, so never modified in place below)
+    companies_df = _load_companies()
+    policies_df = _load_policies()
 
     # Find the target company
     target_company = companies_df[
@@ -30,156 +286,160 @@ def get_top_relevant_policies_rag(company_name: str, limit: int = 3) -> List[Dic
     ]
 
     if target_company.empty:
-        print(f"Company '{company_name}' not found")
+        logger.debug(f"Company '{company_name}' not found")
         return []
 
     target = target_company.iloc[0]
-    print(f'Found target company: {target["name"]}')
-    print(f'Company sector: {target["sector"]}')
-    print(f'Company jurisdiction: {target["operating_jurisdiction"]}')
+    logger.debug(f'Found target company: {target["name"]}')
+    logger.debug(f'Company sector: {target["sector"]}')
+    logger.debug(f'Company jurisdiction: {target["operating_jurisdiction"]}')
 
     # Get company continent
     company_continent = get_continent(target['operating_jurisdiction'])
-    print(f'Company continent: {company_continent}')
-
-    # Process policy sectors and geography
-    policies_df['parsed_sectors'] = policies_df['sectors'].apply(parse_sector_list)
-    policies_df['sector_text'] = policies_df['parsed_sectors'].apply(
-        lambda x: ' '.join(x) if x else ''
-    )
-    policies_df['continent'] = policies_df['geography'].apply(get_continent)
+    logger.debug(f'Company continent: {company_continent}')
 
     # Filter out policies with no sectors
-    policies_with_sectors = policies_df[policies_df['sector_text'].str.len() > 0].copy()
+    policies_with_sectors = policies_df[policies_df['sector_text'].str.len() > 0]
 
     if policies_with_sectors.empty:
-        print('No policies found with sector information')
+        logger.debug('No policies found with sector information')
         return []
 
-    print(f'Found {len(policies_with_sectors)} policies with sector information')
+    logger.debug(f'Found {len(policies_with_sectors)} policies with sector information')
 
-    # Initialize sentence transformer model for all policies
-    model = SentenceTransformer('all-MiniLM-L6-v2')  # Lightweight but effective model
+    # Shared sentence transformer model, loaded on first use
+    model = _get_model()
 
     # Prepare texts for encoding
     company_sector = target['sector']
     policy_sectors = policies_with_sectors['sector_text'].tolist()
 
     # Encode company sector and policy sectors
-    print('Encoding sectors with sentence transformers...')
-    company_embedding = model.encode([company_sector])
-    policy_embeddings = model.encode(policy_sectors)
-
-    # Calculate cosine similarity between company sector and all policy sectors
-    similarities = cosine_similarity(company_embedding, policy_embeddings).flatten()
+    logger.debug('Encoding sectors with sentence transformers...')
+    company_embedding = _encode_company(company_sector)
+    policy_embeddings = _encode_policy_sectors(model, policy_sectors)
 
-    # Add similarity scores to dataframe
-    policies_to_rank = policies_with_sectors.copy()
-    policies_to_rank['sector_similarity'] = similarities
+    # Embeddings are L2-normalized, so cosine similarity is a plain dot product
+    similarities = policy_embeddings @ company_embedding
 
-    # Handle geographic prioritization with smart filling
+    # Handle geographic prioritization with smart filling, selecting row positions with NumPy
     if company_continent:
-        # Get continental policies
-        continental_policies = policies_to_rank[policies_to_rank['continent'] == company_continent]
-        non_continental_policies = policies_to_rank[
-            policies_to_rank['continent'] != company_continent
-        ]
+        # Split policy positions into continental and non-continental
+        continental_mask = (policies_with_sectors['continent'] == company_continent).to_numpy()
+        continental_positions = np.flatnonzero(continental_mask)
+        non_continental_positions = np.flatnonzero(~continental_mask)
+        continental_count = len(continental_positions)
 
-        if len(continental_policies) >= limit:
+        if continental_count >= limit:
             # Enough continental policies, use only those
-            print(f'Found {len(continental_policies)} policies from {company_continent}')
-            top_policies = continental_policies.sort_values(
-                'sector_similarity', ascending=False
-            ).head(limit)
+            logger.debug(f'Found {continental_count} policies from {company_continent}')
+            top_positions = continental_positions[
+                _top_k_positions(similarities[continental_positions], limit)
+            ]
             geographic_scope = f'Continental ({company_continent})'
-        elif len(continental_policies) > 0:
+        elif continental_count > 0:
             # Some continental policies, fill remaining with best non-continental
-            continental_count = len(continental_policies)
             remaining_slots = limit - continental_count
-            print(
+            logger.debug(
                 f'Found {continental_count} policies from {company_continent}, '
                 f'filling {remaining_slots} slots with best global policies'
             )
 
-            # Get top continental policies (all of them, sorted by sector similarity)
-            top_continental = continental_policies.sort_values('sector_similarity', ascending=False)
-
-            # Get top non-continental policies to fill remaining slots
-            top_non_continental = non_continental_policies.sort_values(
-                'sector_similarity', ascending=False
-            ).head(remaining_slots)
-
-            # Combine them - continental first, then non-continental
-            top_policies = pd.concat([top_continental, top_non_continental])
+            # Combine them - all continental (by sector similarity) first, then the best
+            # non-continental policies to fill the remaining slots
+            top_positions = np.concatenate(
+                [
+                    continental_positions[
+                        _top_k_positions(similarities[continental_positions], continental_count)
+                    ],
+                    non_continental_positions[
+                        _top_k_positions(similarities[non_continental_positions], remaining_slots)
+                    ],
+                ]
+            )
             geographic_scope = f'Mixed ({continental_count} continental + {remaining_slots} global)'
         else:
             # No continental policies, use global search
-            print(f'No policies found from {company_continent}, searching globally')
-            top_policies = policies_to_rank.sort_values('sector_similarity', ascending=False).head(
-                limit
-            )
+            logger.debug(f'No policies found from {company_continent}, searching globally')
+            top_positions = _top_k_positions(similarities, limit)
             geographic_scope = 'Global (no continental match)'
     else:
         # Company continent unknown, use global search
-        print('Company continent unknown, searching globally')
-        top_policies = policies_to_rank.sort_values('sector_similarity', ascending=False).head(
-            limit
-        )
+        logger.debug('Company continent unknown, searching globally')
+        top_positions = _top_k_positions(similarities, limit)
         geographic_scope = 'Global (company continent unknown)'
 
-    # Format results
-    results = []
-    for rank, (_, policy) in enumerate(top_policies.iterrows(), 1):
-        result = {
-            'rank': rank,
-            'policy_id': policy['id'],
-            'policy_name': policy['name'],
-            'geography': policy['geography'],
-            'continent': policy['continent'],
-            'status': policy['status'],
-            'published_date': policy['published_date'],
-            'policy_sectors': policy['parsed_sectors'],
-            'sector_similarity': policy['sector_similarity'],
-            'source_url': policy['source_url'],
-            'description': policy['description'][:200] + '...'
-            if len(str(policy['description'])) > 200
-            else policy['description'],
-            'geographic_scope': geographic_scope,
-        }
+    # Only the selected rows are copied, with their similarity scores attached
+    top_policies = policies_with_sectors.iloc[top_positions].assign(
+        sector_similarity=similarities[top_positions]
+    )
 
-        # Add relevance reasons
-        reasons = []
+    # Format results column-wise, then convert to records once
+    similarity = top_policies['sector_similarity'].to_numpy()
+    continent = top_policies['continent'].astype(object)
+    # Unknown continents come back from the categorical column as NaN
+    continent = continent.where(continent.notna(), None)
+    description = top_policies['description']
+    description = description.mask(
+        description.str.len() > 200, description.str.slice(0, 200) + '...'
+    )
 
-        # Geographic relevance
-        if company_continent and policy['continent'] == company_continent:
-            reasons.append(f'✅ Same continent ({company_continent})')
-        elif company_continent and policy['continent']:
-            reasons.append(f'🌍 Different continent ({policy["continent"]})')
-        elif not company_continent:
-            reasons.append('❓ Company continent unknown')
-        else:
-            reasons.append('❓ Policy continent unknown')
+    # Geographic relevance
+    if company_continent:
+        geographic_reasons = np.where(
+            continent == company_continent,
+            f'✅ Same continent ({company_continent})',
+            np.where(
+                continent.notna(),
+                '🌍 Different continent (' + continent.fillna('') + ')',
+                '❓ Policy continent unknown',
+            ),
+        )
+    else:
+        geographic_reasons = np.full(len(top_policies), '❓ Company continent unknown')
 
-        # Sector similarity (secondary factor)
-        if policy['sector_similarity'] > 0.8:
-            reasons.append(f'🎯 High semantic similarity ({policy["sector_similarity"]:.3f})')
-        elif policy['sector_similarity'] > 0.6:
-            reasons.append(f'🎯 Medium semantic similarity ({policy["sector_similarity"]:.3f})')
-        else:
-            reasons.append(f'🎯 Low semantic similarity ({policy["sector_similarity"]:.3f})')
+    # Sector similarity (secondary factor)
+    similarity_levels = np.select(
+        [similarity > 0.8, similarity > 0.6], ['High', 'Medium'], default='Low'
+    )
+    similarity_reasons = [
+        f'🎯 {level} semantic similarity ({score:.3f})'
+        for level, score in zip(similarity_levels, similarity)
+    ]
 
-        # Show which specific sectors matched
-        company_sector_lower = company_sector.lower()
-        matching_sectors = [
+    # Show which specific sectors matched (needs a per-row list intersection)
+    company_sector_lower = company_sector.lower()
+    matching_sectors = top_policies['parsed_sectors'].apply(
+        lambda sectors: [
             s
-            for s in policy['parsed_sectors']
-            if s.lower() in company_sector_lower or company_sector_lower in s.lower()
+            for s, s_lower in zip(sectors, map(str.lower, sectors))
+            if s_lower in company_sector_lower or company_sector_lower in s_lower
         ]
-        if matching_sectors:
-            reasons.append(f'Direct sector match: {", ".join(matching_sectors)}')
+    )
 
-        result['relevance_reasons'] = reasons
-        results.append(result)
+    results = pd.DataFrame(
+        {
+            'rank': np.arange(1, len(top_policies) + 1),
+            'policy_id': top_policies['id'],
+            'policy_name': top_policies['name'],
+            'geography': top_policies['geography'],
+            'continent': continent,
+            'status': top_policies['status'],
+            'published_date': top_policies['published_date'],
+            'policy_sectors': top_policies['parsed_sectors'],
+            'sector_similarity': similarity,
+            'source_url': top_policies['source_url'],
+            'description': description,
+            'geographic_scope': geographic_scope,
+            'relevance_reasons': [
+                [geographic, similar]
+                + ([f'Direct sector match: {", ".join(matches)}'] if matches else [])
+                for geographic, similar, matches in zip(
+                    geographic_reasons, similarity_reasons, matching_sectors
+                )
+            ],
+        }
+    ).to_dict('records')
 
     return results
 
@@ -195,7 +455,7 @@ def print_policy_ranking_report(company_name: str, limit: int = 3) -> None:
     """
     try:
         # Get companies data for target info
-        companies_df = pd.read_csv('src/data/cleaned_companies.csv')
+        companies_df = _load_companies()
 
         # Find target company
         target_company = companies_df[
@@ -1,8 +1,27 @@
 import ast
+import functools
 
+import numpy as np
 import pandas as pd
 import pycountry_convert as pc
 
+# Every continent name pycountry-convert can return, as a fixed categorical dtype so the
+# continent column stores small integer codes with the same meaning in every build
+CONTINENT_DTYPE = pd.CategoricalDtype(
+    ['Africa', 'Antarctica', 'Asia', 'Europe', 'North America', 'Oceania', 'South America']
+)
+
+# Non-empty list literals of plain single-quoted strings, e.g. "['Water', 'Health']"
+_SIMPLE_SECTOR_LIST_RE = r"\['[^',\\]*'(?:, '[^',\\]*')*\]"
+
+# Common variations and abbreviations of geography names
+GEOGRAPHY_MAPPINGS = {
+    'USA': 'United States',
+    'US': 'United States',
+    'UK': 'United Kingdom',
+    'UAE': 'United Arab Emirates',
+}
+
 
 def get_continent(geography_str: str) -> str | None:
     """
@@ -17,19 +36,22 @@ def get_continent(geography_str: str) -> str | None:
     if pd.isna(geography_str):
         return None
 
-    geography_str = str(geography_str).strip()
+    return _get_continent_cached(str(geography_str).strip())
+
 
-    # Handle common variations and abbreviations
-    geography_mappings = {
-        'USA': 'United States',
-        'US': 'United States',
-        'UK': 'United Kingdom',
-        'UAE': 'United Arab Emirates',
-    }
+@functools.lru_cache(maxsize=None)
+def _get_continent_cached(geography_str: str) -> str | None:
+    """
+    Look up the continent for a cleaned geography string, memoized per distinct value.
+
+    Args:
+        geography_str: Stripped, non-null geography string
 
+    Returns:
+        Continent name or None if not found
+    """
     # Apply common mappings
-    if geography_str in geography_mappings:
-        geography_str = geography_mappings[geography_str]
+    geography_str = GEOGRAPHY_MAPPINGS.get(geography_str, geography_str)
 
     try:
         # Convert country name to continent
@@ -65,3 +87,51 @@ def parse_sector_list(sector_str):
     except (ValueError, SyntaxError):
         # If parsing fails, treat as single string
         return [str(sector_str)]
+
+
+def parse_sector_column(sector_series: pd.Series) -> pd.Series:
+    """
+    Parse a column of string-encoded sector lists back to lists.
+
+    Simple literals are split with vectorized string operations; anything else (empty lists,
+    escaped quotes, nulls) falls back to parse_sector_list.
+
+    Args:
+        sector_series: Series of string representations of lists
+
+    Returns:
+        Series of lists of sector strings, aligned with the input
+    """
+    # The .str accessor needs strings; an all-missing column is read back as float64
+    if not (sector_series.dtype == object or isinstance(sector_series.dtype, pd.StringDtype)):
+        return sector_series.map(parse_sector_list)
+
+    simple = sector_series.str.fullmatch(_SIMPLE_SECTOR_LIST_RE, na=False).to_numpy(dtype=bool)
+
+    # "['Water', 'Health']" -> "Water', 'Health" -> ['Water', 'Health']
+    parsed = sector_series.str.slice(2, -2).str.split("', '").to_numpy(dtype=object, copy=True)
+    for i in np.flatnonzero(~simple):
+        parsed[i] = parse_sector_list(sector_series.iat[i])
+
+    return pd.Series(parsed, index=sector_series.index, name=sector_series.name)
+
+
+def add_policy_ranking_columns(policies_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derive the columns used to rank policies from the cleaned policies data.
+
+    Args:
+        policies_df: Cleaned policies DataFrame with string-encoded sectors
+
+    Returns:
+        New DataFrame with parsed_sectors, sector_text and continent (categorical) columns
+    """
+    # Geographies repeat heavily, so look up each distinct value once and map
+    continent_map = {g: get_continent(g) for g in policies_df['geography'].unique()}
+
+    parsed_sectors = parse_sector_column(policies_df['sectors'])
+    return policies_df.assign(
+        parsed_sectors=parsed_sectors,
+        sector_text=parsed_sectors.str.join(' '),
+        continent=policies_df['geography'].map(continent_map).astype(CONTINENT_DTYPE),
+    )
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from src.data_processor import DataProcessor
+
+
+@pytest.fixture
+def processor(tmp_path):
+    path = tmp_path / 'policies.csv'
+    path.write_text('id,name\n')
+    return DataProcessor(path)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '["a\\nb"]',
+        "['a\\nb', 'c']",
+        '["caf\\u00e9"]',
+        "['it\\'s', 'x']",
+        '["back\\\\slash"]',
+        'a\\b, c',
+    ],
+)
+def test_parse_list_column_matches_row_parser_for_escapes(processor, value):
+    series = pd.Series([value, "['Energy', 'Transport']"], dtype='string')
+
+    parsed = processor._parse_list_column(series)
+
+    assert parsed.tolist() == [
+        processor._parse_list_field(value),
+        ['Energy', 'Transport'],
+    ]
+
+
+def test_parse_list_column_decodes_escapes(processor):
+    series = pd.Series(['["a\\nb"]', '["caf\\u00e9"]'], dtype='string')
+
+    assert processor._parse_list_column(series).tolist() == [['a\nb'], ['café']]